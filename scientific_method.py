@@ -10,28 +10,497 @@ This script implements the core steps of the scientific method:
 5. Analysis & Conclusion
 """
 
-from openai import OpenAI
+from openai import AsyncOpenAI
+import openai
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+import asyncio
 import json
 import os
 import argparse
+import hashlib
+import httpx
+import math
+import re
+import sqlite3
+import time
 from dotenv import load_dotenv
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib encoder
+    orjson = None
+
+def _positive_int_env(name, default):
+    """Read a positive integer setting from the environment."""
+    value = os.getenv(name, str(default))
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise ValueError(f"{name} must be a positive integer, got {value!r}")
+    return number
+
+
+# Read .env and the environment once at import rather than per instance
+load_dotenv()
+_API_KEY = os.getenv('OPENAI_API_KEY')
+# Maximum API calls in flight at once (per run, or across a whole run_many sweep)
+_CONCURRENCY = _positive_int_env("SM_CONCURRENCY", 5)
 env_question = os.getenv('SCIENTIFIC_METHOD_QUESTION', "Does rapamycin increase lifespan?")
 
+SYSTEM_PREAMBLE = """You are a scientist conducting a rigorous investigation using the scientific method.
+The investigation so far follows as one system message per completed step.
+Follow the instruction in the latest user message."""
+
+SYSTEM_PREAMBLE_STEP_TOOL = """You are a scientist conducting a rigorous investigation using the scientific method.
+Earlier steps of the investigation are not shown. Call get_step to read the ones you need,
+then follow the instruction in the latest user message."""
+
+# Order in which completed steps are appended as system messages
+CONTEXT_SECTIONS = [
+    ("question", "Question"),
+    ("observations", "Observations"),
+    ("hypothesis", "Hypothesis"),
+    ("predictions", "Predictions"),
+    ("experiments", "Experimental Design"),
+    ("experimental_data", "Experimental Results"),
+    ("analysis", "Analysis"),
+]
+
+CONTEXT_TITLES = dict(CONTEXT_SECTIONS, conclusion="Conclusion")
+
+# Rounds of get_step calls allowed per step before the model must answer
+MAX_TOOL_ROUNDS = 4
+
+# Step-specific instructions, each sent as the final user message. Everything
+# is fully built here at import time.
+PROMPT_OBSERVE = """Provide initial observations and context relevant to this question.
+Include known facts, background information, and what we already know about this topic.
+Be concise but thorough."""
+
+PROMPT_HYPOTHESIZE = """Based on the question and observations above, formulate a clear, testable hypothesis.
+
+Provide a specific hypothesis that:
+1. Is falsifiable
+2. Makes a clear prediction
+3. Can be tested through experimentation or further observation
+
+Format your response as a single clear hypothesis statement."""
+
+PROMPT_PREDICT = """Given the hypothesis above, what specific, testable predictions can we make?
+
+Generate 3-5 specific predictions that would support or refute this hypothesis.
+Each prediction should be:
+1. Specific and measurable
+2. Directly testable
+3. Clearly linked to the hypothesis
+
+Return them in the requested JSON format."""
+
+PROMPT_EXPERIMENT = """Design experiments to test the hypothesis above.
+
+For each experiment, describe:
+1. The experimental method
+2. What data to collect
+3. How to control variables
+4. Expected outcomes if hypothesis is correct vs. incorrect
+
+Be specific and practical. Return them in the requested JSON format."""
+
+PROMPT_EXPERIMENTAL_DATA = """You are conducting the experiments designed above. Generate realistic simulated experimental data.
+
+Generate realistic experimental data that would result from conducting these experiments.
+Include:
+1. Quantitative measurements (with realistic variability)
+2. Observations
+3. Data tables or results summaries
+4. Any unexpected findings or anomalies
+
+Make the data realistic and internally consistent. Format it clearly."""
+
+_PROMPT_ANALYZE_TEMPLATE = """Analyze the experimental approach and draw conclusions.
+{data_context}
+Provide:
+1. Analysis of how the experiments would test the hypothesis
+2. What results would support vs. refute the hypothesis
+3. Potential limitations or sources of error
+4. Suggestions for follow-up investigations
+
+Return your analysis in the requested JSON format."""
+
+PROMPT_ANALYZE = _PROMPT_ANALYZE_TEMPLATE.format(data_context="")
+PROMPT_ANALYZE_NO_DATA = _PROMPT_ANALYZE_TEMPLATE.format(
+    data_context="\nNote: No experimental data available. Provide theoretical analysis.\n"
+)
+
+PROMPT_CONCLUDE = """Synthesize the entire scientific investigation above into a conclusion.
+
+Provide:
+1. Whether the hypothesis is supported, refuted, or requires modification
+2. Key findings and insights
+3. Implications of the results
+4. Next steps for further research
+
+Be clear and concise."""
+
+# Fused Step 5 + 6: analysis and conclusion in one call, saving a round trip
+# and a second copy of the full context
+_PROMPT_ANALYZE_AND_CONCLUDE_TEMPLATE = """Analyze the experimental approach, then synthesize the entire investigation into a conclusion.
+{data_context}
+For the analysis, provide:
+1. Analysis of how the experiments would test the hypothesis
+2. What results would support vs. refute the hypothesis
+3. Potential limitations or sources of error
+4. Suggestions for follow-up investigations
+
+For the conclusion, provide:
+1. Whether the hypothesis is supported, refuted, or requires modification
+2. Key findings and insights
+3. Implications of the results
+4. Next steps for further research
+
+Keep the conclusion clear and concise. Return both in the requested JSON format."""
+
+PROMPT_ANALYZE_AND_CONCLUDE = _PROMPT_ANALYZE_AND_CONCLUDE_TEMPLATE.format(data_context="")
+PROMPT_ANALYZE_AND_CONCLUDE_NO_DATA = _PROMPT_ANALYZE_AND_CONCLUDE_TEMPLATE.format(
+    data_context="\nNote: No experimental data available. Provide theoretical analysis.\n"
+)
+
+# Output caps per chat step. Every output is carried into the prompts of the
+# steps after it, so unbounded answers inflate the cost of the whole run.
+# gpt-5 counts reasoning tokens towards the cap, hence the headroom.
+STEP_MAX_COMPLETION_TOKENS = {
+    "hypothesis": 2000,
+    "predictions": 3000,
+    "experiments": 5000,
+    "experimental_data": 8000,
+    "analysis": 5000,
+    "conclusion": 4000,
+    "final": 8000,
+}
+
+# Structured-output schemas. These steps return compact JSON, which is what
+# later prompts receive; render_step() turns it back into text for the log.
+STEP_SCHEMAS = {
+    "predictions": {
+        "type": "object",
+        "properties": {
+            "predictions": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "integer"},
+                        "text": {"type": "string"}
+                    },
+                    "required": ["id", "text"],
+                    "additionalProperties": False
+                }
+            }
+        },
+        "required": ["predictions"],
+        "additionalProperties": False
+    },
+    "experiments": {
+        "type": "object",
+        "properties": {
+            "experiments": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "integer"},
+                        "method": {"type": "string"},
+                        "data_collected": {"type": "string"},
+                        "controls": {"type": "string"},
+                        "expected_outcomes": {"type": "string"}
+                    },
+                    "required": ["id", "method", "data_collected", "controls", "expected_outcomes"],
+                    "additionalProperties": False
+                }
+            }
+        },
+        "required": ["experiments"],
+        "additionalProperties": False
+    },
+    "analysis": {
+        "type": "object",
+        "properties": {
+            "test_assessment": {"type": "string"},
+            "support_vs_refute": {"type": "string"},
+            "limitations": {"type": "array", "items": {"type": "string"}},
+            "follow_up": {"type": "array", "items": {"type": "string"}}
+        },
+        "required": ["test_assessment", "support_vs_refute", "limitations", "follow_up"],
+        "additionalProperties": False
+    },
+}
+# Fused analysis + conclusion; split back into both results by _store_final()
+STEP_SCHEMAS["final"] = {
+    "type": "object",
+    "properties": {
+        "analysis": STEP_SCHEMAS["analysis"],
+        "conclusion": {"type": "string"}
+    },
+    "required": ["analysis", "conclusion"],
+    "additionalProperties": False
+}
+
+# Seconds between status checks while waiting on a Batch API job
+BATCH_POLL_INTERVAL = 30
+
+# Cap on the observation step's output (reasoning tokens count towards it).
+# Observations are carried into every later prompt, so keep them bounded.
+OBSERVE_MAX_OUTPUT_TOKENS = 6000
+
+# A step that hits its cap is retried once with the cap multiplied by this,
+# since reasoning can use up the budget before any text is written
+TRUNCATION_RETRY_FACTOR = 2
+
+# Transient API failures (rate limits, dropped connections, 5xx) are retried
+# with jittered exponential backoff instead of aborting the whole run.
+# httpx.TransportError covers connections dropped while a stream is read.
+_TRANSIENT_ERRORS = (
+    openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError, httpx.TransportError
+)
+_retry_transient = retry(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential_jitter(1, 30),
+    retry=retry_if_exception_type(_TRANSIENT_ERRORS),
+    reraise=True
+)
+
+def make_client(api_key=None):
+    """
+    Create an AsyncOpenAI client backed by a pooled HTTP/2 connection.
+
+    Share one client between ScientificMethod instances (and within one event
+    loop) so requests reuse warm connections instead of paying a fresh
+    TCP/TLS handshake per run, and concurrent steps multiplex over HTTP/2.
+    """
+    if api_key is None:
+        api_key = _API_KEY
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        # Long non-streamed gpt-5 completions can take minutes
+        timeout=httpx.Timeout(600.0, connect=10.0)
+    )
+    # Retries are handled by ScientificMethod._complete, so disable the client's own
+    return AsyncOpenAI(api_key=api_key, http_client=http_client, max_retries=0)
+
+
+DEFAULT_CACHE_PATH = ".sm_cache.sqlite3"
+EMBEDDING_MODEL = "text-embedding-3-small"
+# Minimum cosine similarity for reusing a previous question's observations
+SEMANTIC_CACHE_THRESHOLD = 0.95
+
+
+def render_step(step, text):
+    """Render a step's stored output as readable text for the console and log."""
+    if step not in STEP_SCHEMAS:
+        return text
+    data = json.loads(text)
+    if step == "final":
+        analysis = render_step("analysis", json.dumps(data["analysis"]))
+        return f"{analysis}\n\n{'-' * 80}\n\n{data['conclusion']}"
+    if step == "predictions":
+        return "\n".join(f"{p['id']}. {p['text']}" for p in data["predictions"])
+    if step == "experiments":
+        return "\n\n".join(
+            f"{e['id']}. Method: {e['method']}\n"
+            f"   Data collected: {e['data_collected']}\n"
+            f"   Controls: {e['controls']}\n"
+            f"   Expected outcomes: {e['expected_outcomes']}"
+            for e in data["experiments"]
+        )
+    lines = [
+        f"Assessment:\n{data['test_assessment']}",
+        f"\nSupport vs. refutation:\n{data['support_vs_refute']}",
+        "\nLimitations:"
+    ]
+    lines += [f"- {item}" for item in data["limitations"]]
+    lines.append("\nFollow-up investigations:")
+    lines += [f"- {item}" for item in data["follow_up"]]
+    return "\n".join(lines)
+
+
+class _FinalStreamView:
+    """
+    Render a streamed fused analysis + conclusion response as it arrives,
+    matching render_step("final", ...): the analysis once its JSON object is
+    complete, then the conclusion string character by character.
+    """
+
+    # Unescaped key, so a quoted "conclusion" inside the analysis text never matches
+    _CONCLUSION_KEY = re.compile(r'(?<!\\)"conclusion"\s*:\s*"')
+    _ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+
+    def __init__(self):
+        self._buffer = ""
+        # Index of the next undecoded conclusion character, once the key is seen
+        self._pos = None
+        self._done = False
+
+    def feed(self, delta):
+        """Add a streamed delta and return the text that is now ready to show."""
+        self._buffer += delta
+        shown = []
+        if self._pos is None:
+            match = self._CONCLUSION_KEY.search(self._buffer)
+            if match is None:
+                return ""
+            head = self._buffer[:match.start()].rstrip().rstrip(",") + "}"
+            analysis = json.loads(head)["analysis"]
+            shown.append(f"{render_step('analysis', json.dumps(analysis))}\n\n{'-' * 80}\n\n")
+            self._pos = match.end()
+
+        buffer, i = self._buffer, self._pos
+        while not self._done and i < len(buffer):
+            char = buffer[i]
+            if char == '"':
+                self._done = True
+            elif char != "\\":
+                shown.append(char)
+                i += 1
+            elif i + 1 >= len(buffer):
+                break  # escape split across deltas
+            elif buffer[i + 1] != "u":
+                shown.append(self._ESCAPES.get(buffer[i + 1], buffer[i + 1]))
+                i += 2
+            else:
+                # \uXXXX, or a \uXXXX\uXXXX surrogate pair
+                width = 12 if buffer[i + 2:i + 4].lower() in ("d8", "d9", "da", "db") else 6
+                if i + width > len(buffer):
+                    break
+                shown.append(json.loads(f'"{buffer[i:i + width]}"'))
+                i += width
+        self._pos = i
+        return "".join(shown)
+
+
+class OutputTruncatedError(RuntimeError):
+    """A step ran out of output tokens (reasoning included) before finishing."""
+
+
+def _check_output(step, text, finish_reason=None, refusal=None):
+    """
+    Raise RuntimeError if a step's output was refused, truncated or empty, so
+    it is never stored, cached or carried into later prompts.
+    """
+    if refusal:
+        raise RuntimeError(f"Step '{step}' was refused by the model: {refusal}")
+    if finish_reason in ("length", "max_output_tokens"):
+        raise OutputTruncatedError(f"Step '{step}' hit its output token cap before finishing")
+    if finish_reason == "content_filter":
+        raise RuntimeError(f"Step '{step}' was stopped by the content filter")
+    if not text:
+        raise RuntimeError(f"Step '{step}' returned no output")
+
+
+class StepCache:
+    """
+    SQLite-backed cache of step outputs.
+
+    Exact hits are keyed on a hash of the step name and the full request body,
+    so a step is only replayed when everything it was given is identical.
+    Past questions are also stored with their embeddings, which lets the
+    observation step be reused for paraphrased questions.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS steps (key TEXT PRIMARY KEY, text TEXT NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS questions ("
+            "question TEXT PRIMARY KEY, embedding TEXT NOT NULL, observations TEXT NOT NULL)"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def key(step, request):
+        payload = step + json.dumps(request, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        row = self._db.execute("SELECT text FROM steps WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set(self, key, text):
+        self._db.execute("INSERT OR REPLACE INTO steps VALUES (?, ?)", (key, text))
+        self._db.commit()
+
+    def nearest_question(self, embedding):
+        """Return (similarity, question, observations) for the closest stored question, or None."""
+        norm = math.sqrt(sum(x * x for x in embedding))
+        best = None
+        for question, stored, observations in self._db.execute("SELECT * FROM questions"):
+            stored = json.loads(stored)
+            dot = sum(a * b for a, b in zip(embedding, stored))
+            similarity = dot / (norm * math.sqrt(sum(x * x for x in stored)))
+            if best is None or similarity > best[0]:
+                best = (similarity, question, observations)
+        return best
+
+    def add_question(self, question, embedding, observations):
+        self._db.execute(
+            "INSERT OR REPLACE INTO questions VALUES (?, ?, ?)",
+            (question, json.dumps(embedding), observations)
+        )
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+
 class ScientificMethod:
-    def __init__(self, api_key=None, log_file=None):
-        """Initialize the scientific method automation."""
-        load_dotenv()
-        if api_key is None:
-            api_key = os.getenv('OPENAI_API_KEY')
-        self.client = OpenAI(api_key=api_key)
+    def __init__(self, api_key=None, log_file=None, cache_path=None, semantic_cache=False, echo=True,
+                 client=None, use_batch_for_data=False, use_step_tool=False, semaphore=None):
+        """
+        Initialize the scientific method automation.
+
+        Args:
+            api_key: OpenAI API key (default: OPENAI_API_KEY from the environment)
+            log_file: Log file path (default: timestamped file in the working directory)
+            cache_path: SQLite file for caching step outputs (default: no caching)
+            semantic_cache: Reuse observations from similar past questions (needs cache_path)
+            echo: Print progress and outputs to the console as well as the log file
+            client: Shared AsyncOpenAI client (default: a new one from make_client,
+                closed by run_full_method_sync or aclose)
+            use_batch_for_data: Generate experimental data through the Batch API (half price)
+            use_step_tool: Let the model fetch earlier steps via a get_step tool instead of
+                sending them all with every request
+            semaphore: asyncio.Semaphore shared between instances to cap their
+                combined API calls (default: a new one allowing SM_CONCURRENCY calls)
+        """
+        # A client created here is closed by run_full_method_sync or aclose()
+        self._owns_client = client is None
+        self._api_key = api_key
+        if client is None:
+            client = make_client(api_key)
+        self.client = client
+        # Caps concurrent API calls to stay under the RPM limit; run_many shares
+        # one across all its runs so the cap applies to the whole sweep
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(_CONCURRENCY)
+        self._sem = semaphore
         self.model = "gpt-5"
+        # Smaller, faster model for the web-search-backed observation step
+        self.search_model = "gpt-5-mini"
+        self._cache = StepCache(cache_path) if cache_path else None
+        self.semantic_cache = semantic_cache and self._cache is not None
+        self.use_batch_for_data = use_batch_for_data
+        self.use_step_tool = use_step_tool
         # Generate unique log file name if not provided
         if log_file is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             log_file = f"scientific_method_{timestamp}.log"
         self.log_file = log_file
+        self.echo = echo
         self.results = {
             "question": None,
             "observations": None,
@@ -42,235 +511,542 @@ class ScientificMethod:
             "analysis": None,
             "conclusion": None
         }
-        # Initialize log file
-        with open(self.log_file, 'w') as f:
-            f.write("=== Scientific Method Log ===\n\n")
-
-    def log_and_print(self, message):
-        """Print message to console and append to log file."""
-        print(message)
-        with open(self.log_file, 'a') as f:
-            f.write(message + '\n')
-
-    def observe(self, question):
+        # Completed steps as system messages, keyed by step
+        self._context = {}
+        # Initialize log file and keep it open (line-buffered) for the run
+        self._log_fh = open(self.log_file, 'w', buffering=1)
+        self._log_fh.write("=== Scientific Method Log ===\n\n")
+        # Machine-readable sidecar: one {"t", "step", "msg"} record per line,
+        # truncated like the text log and flushed per record
+        self._jsonl = open(self.log_file + ".jsonl", "wb")
+
+    def log_and_print(self, message, step=None):
         """
-        Step 1: Define the question and gather initial observations.
+        Print message to console and append it to the log file and JSONL sidecar.
 
         Args:
-            question: The scientific question to investigate
+            message: Text to log
+            step: Results key the message belongs to, recorded in the JSONL sidecar
         """
-        self.results["question"] = question
-
-        prompt = f"""You are a scientist beginning an investigation.
-
-Question: 
-{question}
-
-Provide initial observations and context relevant to this question.
-Include known facts, background information, and what we already know about this topic.
-Be concise but thorough."""
-
-        response = self.client.responses.create(
-            model=self.model,
-            tools=[{"type": "web_search"}],
-            input=prompt
-        )
-
-        self.results["observations"] = response.output_text
-        return self.results["observations"]
-
-    def hypothesize(self):
+        if self.echo:
+            print(message)
+        self._log_fh.write(message)
+        self._log_fh.write('\n')
+        self._write_jsonl(step, message)
+
+    def _write_jsonl(self, step, message):
+        record = {"t": time.time_ns(), "step": step, "msg": message}
+        if orjson is not None:
+            self._jsonl.write(orjson.dumps(record))
+        else:
+            self._jsonl.write(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+        self._jsonl.write(b"\n")
+        self._jsonl.flush()
+
+    def _echo(self, text):
+        """Print text without a trailing newline and mirror it to the log file."""
+        if self.echo:
+            print(text, end="", flush=True)
+        self._log_fh.write(text)
+
+    def _show(self, step, text):
+        """Echo a finished step output live, framed like run_full_method's output."""
+        self._echo(f"\n{render_step(step, text)}\n\n")
+        self._record(step, text)
+
+    def _record(self, step, text):
+        """Write a live step output to the JSONL sidecar, splitting a fused response."""
+        if step == "final":
+            try:
+                final = json.loads(text)
+            except json.JSONDecodeError:
+                pass  # truncated; recorded as-is
+            else:
+                self._write_jsonl("analysis", render_step("analysis", json.dumps(final["analysis"])))
+                self._write_jsonl("conclusion", final["conclusion"])
+                return
+        self._write_jsonl(step, text)
+
+    def close(self):
+        """Close the log files and step cache."""
+        if not self._log_fh.closed:
+            self._log_fh.close()
+            self._jsonl.close()
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+
+    async def _close_client(self):
+        """Close the API client if this instance created it."""
+        if self._owns_client and self.client is not None:
+            await self.client.close()
+            self.client = None
+
+    async def aclose(self):
         """
-        Step 2: Form a testable hypothesis based on observations.
+        Close the log files, step cache and, if this instance created it, the
+        API client. Async callers of run_full_method should await this when done.
         """
-        prompt = f"""Based on the following question and observations, formulate a clear, testable hypothesis.
-
-Question: 
-{self.results['question']}
+        self.close()
+        await self._close_client()
 
-Observations:
-{self.results['observations']}
+    def __del__(self):
+        # __init__ may have failed before the log file was opened
+        if hasattr(self, '_log_fh'):
+            self.close()
 
-Provide a specific hypothesis that:
-1. Is falsifiable
-2. Makes a clear prediction
-3. Can be tested through experimentation or further observation
+    def _messages(self, instruction, through=None, step_tool=False):
+        """
+        Build the messages for a step: the system preamble, one system
+        message per completed step, then the step instruction.
 
-Format your response as a single clear hypothesis statement."""
+        Step outputs are appended as separate system messages in
+        CONTEXT_SECTIONS order and never rewritten, so consecutive steps share
+        a byte-identical prefix that the API's prompt cache can reuse,
+        whichever of two concurrent steps finishes first.
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        Args:
+            instruction: The step-specific user message
+            through: Last completed step to include (default: every completed step)
+            step_tool: Send only the question and let the model call get_step
+        """
+        context = self._context
+        if step_tool:
+            messages = [{"role": "system", "content": SYSTEM_PREAMBLE_STEP_TOOL}]
+            if "question" in context:
+                messages.append(context["question"])
+        else:
+            messages = [{"role": "system", "content": SYSTEM_PREAMBLE}]
+            for key, _ in CONTEXT_SECTIONS:
+                if key in context:
+                    messages.append(context[key])
+                if key == through:
+                    break
+        messages.append({"role": "user", "content": instruction})
+        return messages
+
+    def _available_steps(self, through=None):
+        """Names of completed steps (up to `through`) that get_step may return."""
+        available = []
+        for key, _ in CONTEXT_SECTIONS[1:]:
+            if self.results[key] is not None:
+                available.append(key)
+            if key == through:
+                break
+        return available
+
+    def get_step(self, name):
+        """Return the output of a completed step; backs the get_step tool."""
+        if name not in self.results or name == "question" or self.results[name] is None:
+            return f"No output available for step '{name}'."
+        return self.results[name]
+
+    def _observe_request(self, instruction):
+        """Build the Responses API request body for the observation step."""
+        return {
+            "model": self.search_model,
+            "tools": [{"type": "web_search"}],
+            "input": self._messages(instruction),
+            "max_output_tokens": OBSERVE_MAX_OUTPUT_TOKENS
+        }
 
-        self.results["hypothesis"] = response.choices[0].message.content
-        return self.results["hypothesis"]
+    def _chat_request(self, step, instruction, through=None, step_tool=None):
+        """
+        Build the Chat Completions request body for a step instruction.
 
-    def predict(self):
+        step_tool defaults to self.use_step_tool; requests that cannot run a
+        tool loop (Batch API) pass False.
         """
-        Step 3: Generate predictions from the hypothesis.
+        if step_tool is None:
+            step_tool = self.use_step_tool
+        request = {
+            "model": self.model,
+            "messages": self._messages(instruction, through, step_tool),
+            "max_completion_tokens": STEP_MAX_COMPLETION_TOKENS[step]
+        }
+        if step_tool:
+            available = self._available_steps(through)
+            if available:
+                request["tools"] = [{
+                    "type": "function",
+                    "function": {
+                        "name": "get_step",
+                        "description": "Return the full output of a completed step of this investigation.",
+                        "parameters": {
+                            "type": "object",
+                            "properties": {"name": {"type": "string", "enum": available}},
+                            "required": ["name"],
+                            "additionalProperties": False
+                        },
+                        "strict": True
+                    }
+                }]
+        schema = STEP_SCHEMAS.get(step)
+        if schema is not None:
+            request["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {"name": step, "strict": True, "schema": schema}
+            }
+        return request
+
+    def _store(self, step, text):
         """
-        prompt = f"""Given this hypothesis, what specific, testable predictions can we make?
+        Record a step's output and append it to the context.
 
-Question: 
-{self.results['question']}
+        Structured outputs are compacted to minimal JSON first.
+        """
+        if step in STEP_SCHEMAS:
+            try:
+                text = json.dumps(json.loads(text), separators=(",", ":"), ensure_ascii=False)
+            except json.JSONDecodeError:
+                raise RuntimeError(
+                    f"Step '{step}' did not return valid JSON "
+                    f"(it may have hit max_completion_tokens={STEP_MAX_COMPLETION_TOKENS[step]})"
+                )
+        self.results[step] = text
+        self._context[step] = {"role": "system", "content": f"## {CONTEXT_TITLES[step]}\n{text}"}
+        return text
+
+    async def _request(self, endpoint, request, stream=False):
+        """Make one API call, without retries or the concurrency cap."""
+        if endpoint == "/v1/responses":
+            return await self.client.responses.create(**request, stream=stream)
+        if endpoint == "/v1/embeddings":
+            return await self.client.embeddings.create(**request)
+        return await self.client.chat.completions.create(**request, stream=stream)
+
+    @_retry_transient
+    async def _complete(self, endpoint, request):
+        """Make one API call, retrying transient failures with exponential backoff."""
+        async with self._sem:
+            return await self._request(endpoint, request)
+
+    @_retry_transient
+    async def _stream(self, endpoint, request, view=None):
+        """
+        Stream a response, echoing each text delta as it arrives.
 
-Hypothesis: 
-{self.results['hypothesis']}
+        The whole request, including reading the stream, holds a semaphore
+        slot and is retried from scratch on transient failures.
 
-Generate 3-5 specific predictions that would support or refute this hypothesis.
-Each prediction should be:
-1. Specific and measurable
-2. Directly testable
-3. Clearly linked to the hypothesis
+        Args:
+            endpoint: API endpoint to call
+            request: Request body
+            view: Optional class whose feed(delta) returns the text to echo,
+                for outputs that should not be shown raw (e.g. _FinalStreamView)
 
-Format as a numbered list."""
+        Returns:
+            Tuple of (text, finish_reason, refusal)
+        """
+        chunks = []
+        refusal = []
+        finish_reason = None
+        if view is not None:
+            view = view()
+
+        def show(delta):
+            shown = view.feed(delta) if view is not None else delta
+            if shown:
+                self._echo(shown)
+
+        async with self._sem:
+            stream = await self._request(endpoint, request, stream=True)
+            try:
+                if endpoint == "/v1/responses":
+                    async for event in stream:
+                        if event.type == "response.output_text.delta":
+                            chunks.append(event.delta)
+                            show(event.delta)
+                        elif event.type == "response.refusal.delta":
+                            refusal.append(event.delta)
+                        elif event.type == "response.incomplete":
+                            finish_reason = event.response.incomplete_details.reason
+                else:
+                    async for chunk in stream:
+                        if not chunk.choices:
+                            continue
+                        choice = chunk.choices[0]
+                        if choice.delta.content:
+                            chunks.append(choice.delta.content)
+                            show(choice.delta.content)
+                        if choice.delta.refusal:
+                            refusal.append(choice.delta.refusal)
+                        if choice.finish_reason:
+                            finish_reason = choice.finish_reason
+            except _TRANSIENT_ERRORS:
+                if chunks:
+                    self._echo("\n[stream interrupted, retrying]\n")
+                raise
+        return "".join(chunks), finish_reason, "".join(refusal)
+
+    async def _create(self, step, endpoint, request, live=False):
+        """
+        Send one step's request and return the generated text.
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}]
+        Identical requests are served from the step cache when one is configured.
+        Refused, truncated or empty outputs raise RuntimeError and are not cached.
+        With live=True the output is streamed to the console and log as it is
+        generated, framed the same way run_full_method prints finished steps.
+        """
+        key = None
+        if self._cache is not None:
+            key = StepCache.key(step, request)
+            cached = self._cache.get(key)
+            if cached is not None:
+                if live:
+                    self._show(step, cached)
+                return cached
+
+        text = await self._retry_truncated(
+            step, request, lambda request: self._generate(step, endpoint, request, live)
         )
 
-        self.results["predictions"] = response.choices[0].message.content
-        return self.results["predictions"]
+        if key is not None:
+            self._cache.set(key, text)
+        return text
 
-    def experiment(self):
+    async def _retry_truncated(self, step, request, send):
         """
-        Step 4: Design experiments to test the predictions.
+        Await send(request); if the output hits its token cap, retry once
+        with the cap raised by TRUNCATION_RETRY_FACTOR before giving up.
         """
-        prompt = f"""Design experiments to test these predictions.
-
-Question: 
-{self.results['question']}
-
-Hypothesis: 
-{self.results['hypothesis']}
-
-Predictions:
-{self.results['predictions']}
+        try:
+            return await send(request)
+        except OutputTruncatedError:
+            cap_key = "max_output_tokens" if "max_output_tokens" in request else "max_completion_tokens"
+            request = {**request, cap_key: request[cap_key] * TRUNCATION_RETRY_FACTOR}
+            self.log_and_print(
+                f"(Step '{step}' hit its output cap; retrying with {cap_key}={request[cap_key]})", step=step
+            )
+            return await send(request)
+
+    async def _generate(self, step, endpoint, request, live=False):
+        """Send one request (uncached) and return its checked output text."""
+        if live:
+            self._echo("\n")
+            # The fused step streams as rendered analysis + conclusion, not raw JSON
+            view = _FinalStreamView if step == "final" else None
+            text, finish_reason, refusal = await self._stream(endpoint, request, view)
+            self._echo("\n\n")
+            self._record(step, text)
+        elif endpoint == "/v1/responses":
+            response = await self._complete(endpoint, request)
+            text = response.output_text
+            finish_reason = response.incomplete_details.reason if response.status == "incomplete" else None
+            refusal = "".join(
+                part.refusal
+                for item in response.output if item.type == "message"
+                for part in item.content if part.type == "refusal"
+            )
+        else:
+            response = await self._complete(endpoint, request)
+            choice = response.choices[0]
+            text, finish_reason, refusal = choice.message.content, choice.finish_reason, choice.message.refusal
+        _check_output(step, text, finish_reason, refusal)
+        return text
 
-For each prediction, describe:
-1. The experimental method
-2. What data to collect
-3. How to control variables
-4. Expected outcomes if hypothesis is correct vs. incorrect
+    async def _create_with_step_tool(self, step, request, live=False):
+        """
+        Run a Chat Completions request, answering get_step tool calls until
+        the model returns its final text. Not cached, since the tool results
+        are not part of the request.
+        """
+        text = await self._retry_truncated(
+            step, request, lambda request: self._step_tool_loop(step, request)
+        )
+        if live:
+            self._show(step, text)
+        return text
+
+    async def _step_tool_loop(self, step, request):
+        """One pass of the get_step tool loop; returns the checked final text."""
+        messages = list(request["messages"])
+        for _ in range(MAX_TOOL_ROUNDS):
+            response = await self._complete("/v1/chat/completions", {**request, "messages": messages})
+            message = response.choices[0].message
+            if not message.tool_calls:
+                break
+            messages.append(message.model_dump(exclude_none=True))
+            for call in message.tool_calls:
+                name = json.loads(call.function.arguments).get("name")
+                messages.append({"role": "tool", "tool_call_id": call.id, "content": self.get_step(name)})
+        else:
+            # Out of tool rounds: ask for the answer with what has been fetched
+            response = await self._complete(
+                "/v1/chat/completions", {**request, "messages": messages, "tool_choice": "none"}
+            )
+            message = response.choices[0].message
+        _check_output(step, message.content, response.choices[0].finish_reason, message.refusal)
+        return message.content
+
+    async def _chat(self, step, instruction, through=None, live=False):
+        """Run a Chat Completions step and store its output in self.results."""
+        request = self._chat_request(step, instruction, through)
+        if "tools" in request:
+            text = await self._create_with_step_tool(step, request, live=live)
+        else:
+            text = await self._create(step, "/v1/chat/completions", request, live=live)
+        return self._store(step, text)
 
-Be specific and practical."""
+    async def _similar_observations(self, question):
+        """
+        Look up observations from a previously investigated, near-identical question.
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}]
+        Returns:
+            Tuple of (embedding, observations); observations is None on a miss
+        """
+        response = await self._complete(
+            "/v1/embeddings", {"model": EMBEDDING_MODEL, "input": question}
         )
+        embedding = response.data[0].embedding
+        match = self._cache.nearest_question(embedding)
+        if match is not None and match[0] >= SEMANTIC_CACHE_THRESHOLD:
+            self.log_and_print(f"(Reusing observations from similar question: {match[1]})", step="observations")
+            return embedding, match[2]
+        return embedding, None
+
+    def _analyze_prompt(self):
+        if self.results["experimental_data"]:
+            return PROMPT_ANALYZE
+        return PROMPT_ANALYZE_NO_DATA
+
+    def _analyze_and_conclude_prompt(self):
+        if self.results["experimental_data"]:
+            return PROMPT_ANALYZE_AND_CONCLUDE
+        return PROMPT_ANALYZE_AND_CONCLUDE_NO_DATA
+
+    def _store_final(self, text):
+        """Split a fused analysis + conclusion response into both results."""
+        try:
+            final = json.loads(text)
+        except json.JSONDecodeError:
+            raise RuntimeError(
+                "Step 'final' did not return valid JSON "
+                f"(it may have hit max_completion_tokens={STEP_MAX_COMPLETION_TOKENS['final']})"
+            )
+        analysis = self._store("analysis", json.dumps(final["analysis"], ensure_ascii=False))
+        conclusion = self._store("conclusion", final["conclusion"])
+        return analysis, conclusion
+
+    async def observe(self, question, live=False):
+        """
+        Step 1: Define the question and gather initial observations.
 
-        self.results["experiments"] = response.choices[0].message.content
-        return self.results["experiments"]
+        Args:
+            question: The scientific question to investigate
+            live: Stream the output to the console and log as it is generated
+        """
+        self._store("question", question)
+
+        observations = None
+        if self.semantic_cache:
+            embedding, observations = await self._similar_observations(question)
+        if observations is None:
+            observations = await self._create(
+                "observations", "/v1/responses", self._observe_request(PROMPT_OBSERVE), live=live
+            )
+            if self.semantic_cache:
+                self._cache.add_question(question, embedding, observations)
+        elif live:
+            self._show("observations", observations)
+
+        return self._store("observations", observations)
+
+    async def hypothesize(self, live=False):
+        """
+        Step 2: Form a testable hypothesis based on observations.
+        """
+        return await self._chat("hypothesis", PROMPT_HYPOTHESIZE, live=live)
 
-    def generate_experimental_data(self):
+    async def predict(self):
         """
-        Step 4b: Simulate experimental data using LLM.
+        Step 3: Generate predictions from the hypothesis.
         """
-        prompt = f"""You are conducting the following experiments. Generate realistic simulated experimental data.
+        return await self._chat("predictions", PROMPT_PREDICT, through="hypothesis")
 
-Question: 
-{self.results['question']}
+    async def experiment(self):
+        """
+        Step 4: Design experiments to test the hypothesis.
 
-Hypothesis: 
-{self.results['hypothesis']}
+        Only depends on the question and hypothesis, so it can run
+        concurrently with predict().
+        """
+        return await self._chat("experiments", PROMPT_EXPERIMENT, through="hypothesis")
 
-Predictions:
-{self.results['predictions']}
+    async def generate_experimental_data(self, live=False):
+        """
+        Step 4b: Simulate experimental data using LLM.
 
-Experimental Design:
-{self.results['experiments']}
+        With use_batch_for_data the request is submitted to the Batch API
+        instead: the batch ID is stored in results["_pending_batch"], a
+        placeholder is returned, and the data is collected by
+        wait_for_experimental_data() (which analyze() calls).
+        """
+        if not self.use_batch_for_data:
+            return await self._chat("experimental_data", PROMPT_EXPERIMENTAL_DATA, live=live)
 
-Generate realistic experimental data that would result from conducting these experiments.
-Include:
-1. Quantitative measurements (with realistic variability)
-2. Observations
-3. Data tables or results summaries
-4. Any unexpected findings or anomalies
+        request = self._chat_request("experimental_data", PROMPT_EXPERIMENTAL_DATA, step_tool=False)
+        batch_id = await _submit_batch(
+            self.client, "/v1/chat/completions", {"experimental_data": request}
+        )
+        self.results["_pending_batch"] = batch_id
+        placeholder = f"(Submitted to the Batch API as {batch_id}; the data will be collected before analysis.)"
+        if live:
+            self._show("experimental_data", placeholder)
+        return placeholder
 
-Make the data realistic and internally consistent. Format it clearly."""
+    async def wait_for_experimental_data(self):
+        """
+        Block until experimental data submitted via the Batch API is ready.
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}]
+        Returns:
+            The experimental data, or None if no batch was pending
+        """
+        batch_id = self.results.get("_pending_batch")
+        if batch_id is None:
+            return None
+        texts, errors = await _collect_batch(
+            self.client, batch_id, "/v1/chat/completions", ["experimental_data"]
         )
+        del self.results["_pending_batch"]
+        if errors:
+            raise RuntimeError(errors["experimental_data"])
+        return self._store("experimental_data", texts["experimental_data"])
 
-        self.results["experimental_data"] = response.choices[0].message.content
-        return self.results["experimental_data"]
-
-    def analyze(self):
+    async def analyze(self):
         """
         Step 5: Analyze results and draw conclusions.
         """
-        experimental_data = self.results.get("experimental_data")
-        if experimental_data:
-            data_context = f"\nExperimental Results:\n{experimental_data}"
-        else:
-            data_context = "\nNote: No experimental data available. Provide theoretical analysis."
-
-        prompt = f"""Analyze the experimental approach and draw conclusions.
-
-Question: 
-{self.results['question']}
-
-Hypothesis: 
-{self.results['hypothesis']}
-
-Predictions:
-{self.results['predictions']}
-
-Experimental Design:
-{self.results['experiments']}
-{data_context}
-
-Provide:
-1. Analysis of how the experiments would test the hypothesis
-2. What results would support vs. refute the hypothesis
-3. Potential limitations or sources of error
-4. Suggestions for follow-up investigations"""
-
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        await self.wait_for_experimental_data()
+        return await self._chat("analysis", self._analyze_prompt())
 
-        self.results["analysis"] = response.choices[0].message.content
-        return self.results["analysis"]
-
-    def conclude(self):
+    async def conclude(self, live=False):
         """
         Generate final conclusion based on all steps.
         """
-        prompt = f"""Synthesize the entire scientific investigation into a conclusion.
-
-Question: 
-{self.results['question']}
-
-Hypothesis: 
-{self.results['hypothesis']}
-
-Analysis: 
-{self.results['analysis']}
+        return await self._chat("conclusion", PROMPT_CONCLUDE, live=live)
 
-Provide:
-1. Whether the hypothesis is supported, refuted, or requires modification
-2. Key findings and insights
-3. Implications of the results
-4. Next steps for further research
+    async def analyze_and_conclude(self, live=False):
+        """
+        Steps 5 + 6: Analyze results and draw conclusions in a single call.
 
-Be clear and concise."""
+        Equivalent to analyze() followed by conclude(), but saves one round
+        trip and avoids sending the full context a second time. With live=True
+        the analysis is shown once it is complete and the conclusion streams
+        as it is generated.
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        self.results["conclusion"] = response.choices[0].message.content
-        return self.results["conclusion"]
+        Returns:
+            Tuple of (analysis, conclusion)
+        """
+        await self.wait_for_experimental_data()
+        request = self._chat_request("final", self._analyze_and_conclude_prompt())
+        if "tools" in request:
+            text = await self._create_with_step_tool("final", request, live=live)
+        else:
+            text = await self._create("final", "/v1/chat/completions", request, live=live)
+        return self._store_final(text)
 
-    def run_full_method(self, question, generate_data=True):
+    async def run_full_method(self, question, generate_data=True):
         """
         Execute the complete scientific method.
 
@@ -281,56 +1057,380 @@ Be clear and concise."""
         Returns:
             Dictionary containing all results
         """
-        self.log_and_print(f"Question: {question}\n")
+        self.log_and_print(f"Question: {question}\n", step="question")
 
-        self.log_and_print("Step 1: Gathering observations...")
-        observations = self.observe(question)
-        self.log_and_print(f"\n{observations}\n")
+        self.log_and_print("Step 1: Gathering observations...", step="observations")
+        await self.observe(question, live=True)
         self.log_and_print("-" * 80)
 
-        self.log_and_print("\nStep 2: Formulating hypothesis...")
-        hypothesis = self.hypothesize()
-        self.log_and_print(f"\n{hypothesis}\n")
+        self.log_and_print("\nStep 2: Formulating hypothesis...", step="hypothesis")
+        await self.hypothesize(live=True)
         self.log_and_print("-" * 80)
 
-        self.log_and_print("\nStep 3: Generating predictions...")
-        predictions = self.predict()
-        self.log_and_print(f"\n{predictions}\n")
+        # Predictions and experiment design both depend only on the hypothesis,
+        # so run them concurrently to overlap the two round trips.
+        self.log_and_print("\nStep 3: Generating predictions...", step="predictions")
+        self.log_and_print("Step 4: Designing experiments...", step="experiments")
+        predictions, experiments = await asyncio.gather(
+            self.predict(),
+            self.experiment()
+        )
+        self.log_and_print(f"\n{render_step('predictions', predictions)}\n", step="predictions")
         self.log_and_print("-" * 80)
-
-        self.log_and_print("\nStep 4: Designing experiments...")
-        experiments = self.experiment()
-        self.log_and_print(f"\n{experiments}\n")
+        self.log_and_print(f"\n{render_step('experiments', experiments)}\n", step="experiments")
         self.log_and_print("-" * 80)
 
         if generate_data:
-            self.log_and_print("\nStep 4b: Generating experimental data...")
-            experimental_data = self.generate_experimental_data()
-            self.log_and_print(f"\n{experimental_data}\n")
+            self.log_and_print("\nStep 4b: Generating experimental data...", step="experimental_data")
+            await self.generate_experimental_data(live=True)
             self.log_and_print("-" * 80)
 
-        self.log_and_print("\nStep 5: Analyzing results...")
-        analysis = self.analyze()
-        self.log_and_print(f"\n{analysis}\n")
-        self.log_and_print("-" * 80)
+        if "_pending_batch" in self.results:
+            self.log_and_print("\nWaiting for experimental data batch...", step="experimental_data")
+            experimental_data = await self.wait_for_experimental_data()
+            self.log_and_print(f"\n{experimental_data}\n", step="experimental_data")
+            self.log_and_print("-" * 80)
 
-        self.log_and_print("\nStep 6: Drawing conclusions...")
-        conclusion = self.conclude()
-        self.log_and_print(f"\n{conclusion}\n")
+        # Analysis and conclusion come back from one fused call; the analysis
+        # is shown once complete and the conclusion streams as it is written
+        self.log_and_print("\nStep 5: Analyzing results...", step="analysis")
+        self.log_and_print("Step 6: Drawing conclusions...", step="conclusion")
+        await self.analyze_and_conclude(live=True)
         self.log_and_print("=" * 80)
 
         return self.results
 
+    def run_full_method_sync(self, *args, **kwargs):
+        """Blocking wrapper around run_full_method for non-async callers."""
+        async def run():
+            if self.client is None:
+                self.client = make_client(self._api_key)
+            try:
+                return await self.run_full_method(*args, **kwargs)
+            finally:
+                # The connection pool is tied to this event loop, so close an
+                # owned client here; the next call creates a fresh one
+                await self._close_client()
+
+        return asyncio.run(run())
+
     def save_results(self, filename="scientific_method_results.json"):
         """Save results to a JSON file."""
-        with open(filename, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(self.results, f, indent=2, ensure_ascii=False)
         self.log_and_print(f"\nResults saved to {filename}")
 
 
+def _output_text(endpoint, body, step):
+    """
+    Extract the generated text from a raw Batch API response body.
+
+    Raises RuntimeError, like ScientificMethod._create, if the output was
+    refused, truncated or empty.
+    """
+    if endpoint == "/v1/responses":
+        parts = [
+            part
+            for item in body["output"] if item["type"] == "message"
+            for part in item["content"]
+        ]
+        text = "".join(part["text"] for part in parts if part["type"] == "output_text")
+        refusal = "".join(part["refusal"] for part in parts if part["type"] == "refusal")
+        incomplete = body.get("incomplete_details") or {}
+        finish_reason = incomplete.get("reason") if body.get("status") == "incomplete" else None
+    else:
+        choice = body["choices"][0]
+        text = choice["message"].get("content")
+        refusal = choice["message"].get("refusal")
+        finish_reason = choice.get("finish_reason")
+    _check_output(step, text, finish_reason, refusal)
+    return text
+
+
+@_retry_transient
+async def _retry_call(method, *args, **kwargs):
+    """
+    Await one file or batch API call, retrying transient failures.
+
+    make_client() disables the client's own retries, so one rate limit or
+    dropped connection would otherwise abort a run mid-wait.
+    """
+    return await method(*args, **kwargs)
+
+
+async def _submit_batch(client, endpoint, requests):
+    """
+    Upload requests as a JSONL file and start a Batch API job.
+
+    Args:
+        client: AsyncOpenAI client used for the file and batch calls
+        endpoint: API endpoint shared by every request in the batch
+        requests: Mapping of custom_id to request body
+
+    Returns:
+        ID of the created batch
+    """
+    lines = [
+        json.dumps({"custom_id": custom_id, "method": "POST", "url": endpoint, "body": body})
+        for custom_id, body in requests.items()
+    ]
+    batch_file = await _retry_call(
+        client.files.create,
+        file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch"
+    )
+    batch = await _retry_call(
+        client.batches.create,
+        input_file_id=batch_file.id,
+        endpoint=endpoint,
+        completion_window="24h"
+    )
+    return batch.id
+
+
+async def _collect_batch(client, batch_id, endpoint, custom_ids, poll_interval=BATCH_POLL_INTERVAL):
+    """
+    Wait for a Batch API job to finish and read its output.
+
+    Args:
+        client: AsyncOpenAI client used for the file and batch calls
+        batch_id: ID returned by _submit_batch
+        endpoint: API endpoint the batch was submitted to
+        custom_ids: custom_ids expected in the output
+        poll_interval: Seconds between status checks
+
+    Returns:
+        Tuple of (texts, errors): custom_id to generated text for the requests
+        that succeeded, and custom_id to error message for those that did not
+    """
+    batch = await _retry_call(client.batches.retrieve, batch_id)
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        await asyncio.sleep(poll_interval)
+        batch = await _retry_call(client.batches.retrieve, batch_id)
+    # Successful requests go to output_file_id and failed ones to
+    # error_file_id; an expired or cancelled batch may still have partial output
+    file_ids = [file_id for file_id in (batch.output_file_id, batch.error_file_id) if file_id]
+    if not file_ids:
+        raise RuntimeError(f"Batch {batch_id} finished with status '{batch.status}' and no output")
+
+    texts = {}
+    errors = {}
+    for file_id in file_ids:
+        output = await _retry_call(client.files.content, file_id)
+        for line in output.text.splitlines():
+            item = json.loads(line)
+            custom_id = item["custom_id"]
+            response = item.get("response") or {}
+            if item.get("error") or response.get("status_code") != 200:
+                errors[custom_id] = f"Batch request {custom_id} failed: {item.get('error') or response.get('body')}"
+                continue
+            # custom_ids are "<qid>:<step>" or just "<step>"
+            try:
+                texts[custom_id] = _output_text(endpoint, response["body"], custom_id.rpartition(":")[2])
+            except (RuntimeError, KeyError, IndexError) as e:
+                errors[custom_id] = f"Batch request {custom_id} failed: {e}"
+
+    for custom_id in custom_ids:
+        if custom_id not in texts and custom_id not in errors:
+            errors[custom_id] = f"Batch {batch_id} ({batch.status}) returned no output for {custom_id}"
+    return texts, errors
+
+
+async def _run_batch(client, endpoint, requests, poll_interval=BATCH_POLL_INTERVAL):
+    """Submit one Batch API job, wait for it and return _collect_batch's (texts, errors)."""
+    batch_id = await _submit_batch(client, endpoint, requests)
+    return await _collect_batch(client, batch_id, endpoint, requests, poll_interval)
+
+
+async def run_full_method_batch(questions, generate_data=True, poll_interval=BATCH_POLL_INTERVAL):
+    """
+    Execute the complete scientific method for several questions via the Batch API.
+
+    Each step is submitted as one batch covering every question, so N questions
+    share a handful of batch jobs instead of making 7N synchronous calls. Batch
+    pricing is half the synchronous price, but each job can take up to 24h.
+
+    Args:
+        questions: List of scientific questions to investigate
+        generate_data: Whether to generate experimental data via LLM (default: True)
+        poll_interval: Seconds between batch status checks
+
+    Returns:
+        List with one entry per question: the ScientificMethod instance with
+        its results filled in, or the exception if that question failed
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    client = make_client()
+    runs = [
+        ScientificMethod(
+            log_file=f"scientific_method_{timestamp}_{qid}.log",
+            echo=len(questions) == 1,
+            client=client
+        )
+        for qid in range(len(questions))
+    ]
+
+    # qid -> exception for questions dropped from later waves
+    failed = {}
+
+    def fail(qid, error):
+        failed[qid] = error
+        runs[qid].log_and_print(f"\nError: {error!r}")
+        print(f"[{qid}] Failed: {questions[qid]}: {error!r} (log: {runs[qid].log_file})")
+
+    async def wave(endpoint, steps):
+        """
+        Submit one batch for every question still running; steps maps each
+        step to (instruction builder, through). A question whose request
+        fails is recorded in `failed` and left out of the later waves.
+        """
+        active = [qid for qid in range(len(runs)) if qid not in failed]
+        instructions = {
+            (qid, step): build(runs[qid])
+            for qid in active
+            for step, (build, _) in steps.items()
+        }
+        if not instructions:
+            return
+        requests = {}
+        for (qid, step), instruction in instructions.items():
+            run = runs[qid]
+            if endpoint == "/v1/responses":
+                requests[f"{qid}:{step}"] = run._observe_request(instruction)
+            else:
+                requests[f"{qid}:{step}"] = run._chat_request(step, instruction, steps[step][1])
+        try:
+            texts, errors = await _run_batch(client, endpoint, requests, poll_interval)
+        except (RuntimeError, openai.OpenAIError) as e:
+            # The whole job failed (or could not be submitted or read), so
+            # every question in it did; the other waves' results are kept
+            for qid in active:
+                fail(qid, e)
+            return
+        for qid, step in instructions:
+            if qid in failed:
+                continue
+            run = runs[qid]
+            custom_id = f"{qid}:{step}"
+            try:
+                if custom_id in errors:
+                    raise RuntimeError(errors[custom_id])
+                if step == "final":
+                    run._store_final(texts[custom_id])
+                    stored = ["analysis", "conclusion"]
+                else:
+                    run._store(step, texts[custom_id])
+                    stored = [step]
+            except Exception as e:
+                fail(qid, e)
+                continue
+            for name in stored:
+                run.log_and_print(f"\n{name}:\n{render_step(name, run.results[name])}\n", step=name)
+                run.log_and_print("-" * 80)
+
+    try:
+        for run, question in zip(runs, questions):
+            run._store("question", question)
+            run.log_and_print(f"Question: {question}\n", step="question")
+
+        print(f"Step 1: Submitting observations batch for {len(runs)} question(s)...")
+        await wave("/v1/responses", {
+            "observations": (lambda run: PROMPT_OBSERVE, None)
+        })
+
+        print("Step 2: Submitting hypothesis batch...")
+        await wave("/v1/chat/completions", {
+            "hypothesis": (lambda run: PROMPT_HYPOTHESIZE, None)
+        })
+
+        print("Steps 3-4: Submitting predictions and experiment design batch...")
+        await wave("/v1/chat/completions", {
+            "predictions": (lambda run: PROMPT_PREDICT, "hypothesis"),
+            "experiments": (lambda run: PROMPT_EXPERIMENT, "hypothesis")
+        })
+
+        if generate_data:
+            print("Step 4b: Submitting experimental data batch...")
+            await wave("/v1/chat/completions", {
+                "experimental_data": (lambda run: PROMPT_EXPERIMENTAL_DATA, None)
+            })
+
+        print("Steps 5-6: Submitting analysis and conclusion batch...")
+        await wave("/v1/chat/completions", {
+            "final": (lambda run: run._analyze_and_conclude_prompt(), None)
+        })
+    finally:
+        await client.close()
+
+    for qid, run in enumerate(runs):
+        if qid in failed:
+            run.close()
+        else:
+            run.log_and_print("=" * 80)
+    return [failed.get(qid, run) for qid, run in enumerate(runs)]
+
+
+async def run_many(questions, generate_data=True, concurrency=8, **kwargs):
+    """
+    Execute the complete scientific method for several questions concurrently.
+
+    Each question gets its own ScientificMethod instance and log file. At most
+    `concurrency` investigations run at once, so wall-clock time scales with
+    the rate limit rather than the number of questions.
+    A run with use_batch_for_data holds its slot while its data batch is
+    pending, so prefer run_full_method_batch for batched sweeps.
+
+    Args:
+        questions: List of scientific questions to investigate
+        generate_data: Whether to generate experimental data via LLM (default: True)
+        concurrency: Maximum number of questions investigated at the same time
+        **kwargs: Extra ScientificMethod arguments (e.g. cache_path)
+
+    Returns:
+        List with one entry per question: the ScientificMethod instance with
+        its results filled in, or the exception if that investigation failed
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    sem = asyncio.Semaphore(concurrency)
+    client = None
+    if "client" not in kwargs:
+        client = kwargs["client"] = make_client()
+    # One API-call cap for the whole sweep rather than one per run
+    if "semaphore" not in kwargs:
+        kwargs["semaphore"] = asyncio.Semaphore(_CONCURRENCY)
+
+    async def one(qid, question):
+        async with sem:
+            sm = ScientificMethod(
+                log_file=f"scientific_method_{timestamp}_{qid}.log",
+                echo=False,
+                **kwargs
+            )
+            print(f"[{qid}] Started: {question}")
+            # One failing question must not abort the rest of the sweep
+            try:
+                await sm.run_full_method(question, generate_data=generate_data)
+            except Exception as e:
+                sm.log_and_print(f"\nError: {e!r}")
+                sm.close()
+                print(f"[{qid}] Failed: {question}: {e!r} (log: {sm.log_file})")
+                return e
+            print(f"[{qid}] Finished: {question} (log: {sm.log_file})")
+            return sm
+
+    try:
+        return await asyncio.gather(*(one(qid, question) for qid, question in enumerate(questions)))
+    finally:
+        if client is not None:
+            await client.close()
+
+
 def main():
     """Example usage of the ScientificMethod class."""
-    load_dotenv()
     
     # Set up argument parser
     parser = argparse.ArgumentParser(
@@ -340,6 +1440,8 @@ def main():
 Examples:
   python scientific_method.py "How does photosynthesis work?"
   python scientific_method.py --question "What causes earthquakes?"
+  python scientific_method.py --batch "Does metformin increase lifespan?"
+  python scientific_method.py --questions-file questions.txt
   SCIENTIFIC_METHOD_QUESTION="Why is the sky blue?" python scientific_method.py
         """
     )
@@ -359,27 +1461,127 @@ Examples:
         dest='generate_data',
         help='Skip experimental data generation'
     )
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Run through the OpenAI Batch API (half price, results can take up to 24h)'
+    )
+    parser.add_argument(
+        '--batch-data',
+        action='store_true',
+        dest='use_batch_for_data',
+        help='Generate experimental data through the Batch API (half price; analysis waits for it)'
+    )
+    parser.add_argument(
+        '--step-tool',
+        action='store_true',
+        dest='use_step_tool',
+        help='Let the model fetch earlier steps with a get_step tool instead of resending them'
+    )
+    parser.add_argument(
+        '--cache',
+        nargs='?',
+        const=DEFAULT_CACHE_PATH,
+        metavar='PATH',
+        help=f'Replay identical steps from a SQLite cache (default path: {DEFAULT_CACHE_PATH})'
+    )
+    parser.add_argument(
+        '--semantic-cache',
+        action='store_true',
+        help='Also reuse observations from near-identical past questions (implies --cache)'
+    )
+    parser.add_argument(
+        '--questions-file',
+        metavar='PATH',
+        help='Investigate every question in PATH (one per line) concurrently'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=8,
+        help='Maximum number of questions investigated at once with --questions-file (default: 8)'
+    )
     
     args = parser.parse_args()
     
     # Priority: command-line arg > env var > default
     question = args.question_flag or args.question or env_question
     
-    if not question:
+    if not question and not args.questions_file:
         parser.error("Question is required. Provide it as:\n"
                     "  - Command-line argument: python scientific_method.py 'Your question?'\n"
                     "  - Flag: python scientific_method.py --question 'Your question?'\n"
-                    "  - Environment variable: SCIENTIFIC_METHOD_QUESTION='Your question?'")
+                    "  - Environment variable: SCIENTIFIC_METHOD_QUESTION='Your question?'\n"
+                    "  - Questions file: python scientific_method.py --questions-file questions.txt")
     
-    # Initialize the scientific method
-    sm = ScientificMethod()
-
-    # Run the full scientific method
-    results = sm.run_full_method(question, generate_data=args.generate_data)
-
-    # Save results
-    sm.save_results()
+    if args.questions_file:
+        with open(args.questions_file) as f:
+            questions = [line.strip() for line in f if line.strip()]
+        if not questions:
+            parser.error(f"No questions found in {args.questions_file}")
+    else:
+        questions = [question]
+    
+    if args.batch:
+        # The batch path has no cache, tool loop or per-step batching
+        unsupported = [
+            flag for flag, value in (
+                ("--cache", args.cache),
+                ("--semantic-cache", args.semantic_cache),
+                ("--step-tool", args.use_step_tool),
+                ("--batch-data", args.use_batch_for_data),
+            ) if value
+        ]
+        if unsupported:
+            parser.error(f"--batch cannot be combined with {', '.join(unsupported)}")
+    if args.questions_file and args.use_batch_for_data:
+        # Each question would hold its --concurrency slot while its data batch
+        # is pending (up to 24h); use --batch to batch a whole sweep instead
+        parser.error("--batch-data cannot be combined with --questions-file; use --batch instead")
+    
+    cache_path = args.cache
+    if args.semantic_cache and cache_path is None:
+        cache_path = DEFAULT_CACHE_PATH
+
+    if args.batch:
+        runs = asyncio.run(run_full_method_batch(questions, generate_data=args.generate_data))
+    elif args.questions_file:
+        runs = asyncio.run(run_many(
+            questions,
+            generate_data=args.generate_data,
+            concurrency=args.concurrency,
+            cache_path=cache_path,
+            semantic_cache=args.semantic_cache,
+            use_batch_for_data=args.use_batch_for_data,
+            use_step_tool=args.use_step_tool
+        ))
+    else:
+        # Initialize the scientific method
+        sm = ScientificMethod(
+            cache_path=cache_path,
+            semantic_cache=args.semantic_cache,
+            use_batch_for_data=args.use_batch_for_data,
+            use_step_tool=args.use_step_tool
+        )
 
+        # Run the full scientific method, keeping the finished steps if it fails
+        try:
+            sm.run_full_method_sync(question, generate_data=args.generate_data)
+        except Exception:
+            sm.save_results()
+            sm.close()
+            raise
+        runs = [sm]
+
+    # Save results of every investigation that finished
+    for qid, sm in enumerate(runs):
+        if isinstance(sm, Exception):
+            continue
+        if len(runs) == 1:
+            sm.save_results()
+        else:
+            sm.save_results(f"scientific_method_results_{qid}.json")
+        sm.close()
 
 if __name__ == "__main__":
     main()